@@ -1,13 +1,79 @@
 """Factory for creating tool instances based on configuration."""
 
 import logging
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 
 from .tool import Tool
 
 logger = logging.getLogger(__name__)
 
 
+def _build_openweathermap(tool_config: Dict[str, Any]) -> Tool:
+    """Validate config and create an OpenWeatherMap tool."""
+    from .implementations.openweathermap import OpenWeatherMapTool
+
+    # Validate required parameters
+    api_key = tool_config.get("api_key")
+    if not api_key:
+        raise ValueError("OpenWeatherMap tool requires 'api_key' parameter")
+
+    # Optional parameters
+    location = tool_config.get("location")
+    latitude = tool_config.get("latitude")
+    longitude = tool_config.get("longitude")
+
+    # Must have either location or lat/lon
+    if not location and (latitude is None or longitude is None):
+        raise ValueError(
+            "OpenWeatherMap tool requires either 'location' or both 'latitude' and 'longitude'"
+        )
+
+    return OpenWeatherMapTool(
+        api_key=api_key,
+        location=location,
+        latitude=latitude,
+        longitude=longitude,
+        units=tool_config.get("units", "imperial"),
+        language=tool_config.get("language", "en"),
+    )
+
+
+def _build_rssfeed(tool_config: Dict[str, Any]) -> Tool:
+    """Validate config and create an RSS feed tool."""
+    from .implementations.rssfeed import RSSFeedTool
+
+    # Validate required parameters
+    feed_urls = tool_config.get("feed_urls")
+    if not feed_urls or not isinstance(feed_urls, list) or len(feed_urls) == 0:
+        raise ValueError(
+            "RSSFeed tool requires 'feed_urls' parameter with at least one URL"
+        )
+
+    return RSSFeedTool(
+        feed_urls=feed_urls,
+        data_file=tool_config.get("data_file", "data/seen_articles.json"),
+        max_stories=tool_config.get("max_stories", 10),
+    )
+
+
+def _build_f1(tool_config: Dict[str, Any]) -> Tool:
+    """Create an F1 tool."""
+    from .implementations.f1 import F1Tool
+
+    return F1Tool(
+        base_url=tool_config.get("base_url", F1Tool.DEFAULT_BASE_URL),
+        request_timeout=tool_config.get("request_timeout", 10),
+    )
+
+
+# Tool type identifier -> builder; builders import their tool lazily
+_TOOL_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Tool]] = {
+    "openweathermap": _build_openweathermap,
+    "rssfeed": _build_rssfeed,
+    "f1": _build_f1,
+}
+
+
 def create_tool(tool_config: Dict[str, Any]) -> Tool:
     """
     Create a tool instance based on configuration.
@@ -28,57 +94,8 @@ def create_tool(tool_config: Dict[str, Any]) -> Tool:
     if not tool_type:
         raise ValueError("Tool configuration must specify 'type'")
 
-    if tool_type == "openweathermap":
-        from .implementations.openweathermap import OpenWeatherMapTool
-
-        # Validate required parameters
-        api_key = tool_config.get("api_key")
-        if not api_key:
-            raise ValueError("OpenWeatherMap tool requires 'api_key' parameter")
-
-        # Optional parameters
-        location = tool_config.get("location")
-        latitude = tool_config.get("latitude")
-        longitude = tool_config.get("longitude")
-
-        # Must have either location or lat/lon
-        if not location and (latitude is None or longitude is None):
-            raise ValueError(
-                "OpenWeatherMap tool requires either 'location' or both 'latitude' and 'longitude'"
-            )
-
-        return OpenWeatherMapTool(
-            api_key=api_key,
-            location=location,
-            latitude=latitude,
-            longitude=longitude,
-            units=tool_config.get("units", "imperial"),
-            language=tool_config.get("language", "en"),
-        )
-
-    elif tool_type == "rssfeed":
-        from .implementations.rssfeed import RSSFeedTool
-
-        # Validate required parameters
-        feed_urls = tool_config.get("feed_urls")
-        if not feed_urls or not isinstance(feed_urls, list) or len(feed_urls) == 0:
-            raise ValueError(
-                "RSSFeed tool requires 'feed_urls' parameter with at least one URL"
-            )
-
-        return RSSFeedTool(
-            feed_urls=feed_urls,
-            data_file=tool_config.get("data_file", "data/seen_articles.json"),
-            max_stories=tool_config.get("max_stories", 10),
-        )
-
-    elif tool_type == "f1":
-        from .implementations.f1 import F1Tool
-
-        return F1Tool(
-            base_url=tool_config.get("base_url", F1Tool.DEFAULT_BASE_URL),
-            request_timeout=tool_config.get("request_timeout", 10),
-        )
-
-    else:
+    builder = _TOOL_BUILDERS.get(tool_type)
+    if builder is None:
         raise ValueError(f"Unknown tool type: {tool_type}")
+
+    return builder(tool_config)
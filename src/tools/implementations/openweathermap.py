@@ -1,17 +1,32 @@
 """OpenWeatherMap API tool for weather data enrichment."""
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..tool import Tool
 
 logger = logging.getLogger(__name__)
 
+# Shared session so the current weather and forecast calls reuse one connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_maxsize=4))
+
 
 class OpenWeatherMapTool(Tool):
     """Tool to fetch current and forecast weather from OpenWeatherMap API."""
 
+    # Recent API responses keyed by (endpoint, query params); weather changes on the
+    # order of minutes, so bursts of commands within the TTL share one fetch
+    _CACHE_TTL = 120
+    _CACHE: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+    _CACHE_LOCK = threading.Lock()
+
     def __init__(
         self,
         api_key: str,
@@ -40,6 +55,17 @@ class OpenWeatherMapTool(Tool):
         self.language = language
         self.base_url = "https://api.openweathermap.org/data/2.5"
 
+        # Query params never change per instance, so build them (and their cache
+        # key) once; None when neither coordinates nor a location were given
+        base_params = {"appid": api_key, "units": units, "lang": language}
+        if latitude is not None and longitude is not None:
+            self._params = {**base_params, "lat": latitude, "lon": longitude}
+        elif location:
+            self._params = {**base_params, "q": location}
+        else:
+            self._params = None
+        self._params_key = tuple(sorted(self._params.items())) if self._params else ()
+
     def get_name(self) -> str:
         """Get tool name."""
         return "OpenWeatherMap"
@@ -55,11 +81,12 @@ class OpenWeatherMapTool(Tool):
             Formatted weather data string
         """
         try:
-            # Get current weather
-            current_weather = self._fetch_current_weather()
-
-            # Get forecast
-            forecast = self._fetch_forecast()
+            # Current weather and forecast are independent, so fetch them in parallel
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                current_future = executor.submit(self._fetch_current_weather)
+                forecast_future = executor.submit(self._fetch_forecast)
+                current_weather = current_future.result()
+                forecast = forecast_future.result()
 
             # Format the data for LLM
             weather_report = self._format_weather_data(current_weather, forecast)
@@ -73,49 +100,44 @@ class OpenWeatherMapTool(Tool):
 
     def _fetch_current_weather(self) -> Dict[str, Any]:
         """Fetch current weather from OpenWeatherMap API."""
-        url = f"{self.base_url}/weather"
-        params = {
-            "appid": self.api_key,
-            "units": self.units,
-            "lang": self.language,
-        }
-
-        # Add location parameters
-        if self.latitude is not None and self.longitude is not None:
-            params["lat"] = self.latitude
-            params["lon"] = self.longitude
-        elif self.location:
-            params["q"] = self.location
-        else:
-            raise ValueError("Either location or latitude/longitude must be provided")
-
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-
-        return response.json()
+        return self._get_json("weather")
 
     def _fetch_forecast(self) -> Dict[str, Any]:
         """Fetch 5-day/3-hour forecast from OpenWeatherMap API."""
-        url = f"{self.base_url}/forecast"
-        params = {
-            "appid": self.api_key,
-            "units": self.units,
-            "lang": self.language,
-        }
-
-        # Add location parameters
-        if self.latitude is not None and self.longitude is not None:
-            params["lat"] = self.latitude
-            params["lon"] = self.longitude
-        elif self.location:
-            params["q"] = self.location
-        else:
+        return self._get_json("forecast")
+
+    def _get_json(self, endpoint: str) -> Dict[str, Any]:
+        """
+        GET an OpenWeatherMap endpoint, reusing a response fetched within the TTL.
+
+        Args:
+            endpoint: API endpoint name (e.g., "weather")
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            ValueError: If no location or coordinates were configured
+        """
+        if self._params is None:
             raise ValueError("Either location or latitude/longitude must be provided")
 
-        response = requests.get(url, params=params, timeout=10)
+        key = (endpoint, self._params_key)
+        with self._CACHE_LOCK:
+            cached = self._CACHE.get(key)
+        if cached and time.monotonic() - cached[0] < self._CACHE_TTL:
+            logger.debug(f"Using cached OpenWeatherMap {endpoint} response")
+            return cached[1]
+
+        response = _SESSION.get(
+            f"{self.base_url}/{endpoint}", params=self._params, timeout=10
+        )
         response.raise_for_status()
+        data = response.json()
 
-        return response.json()
+        with self._CACHE_LOCK:
+            self._CACHE[key] = (time.monotonic(), data)
+        return data
 
     def _format_weather_data(
         self, current: Dict[str, Any], forecast: Dict[str, Any]
@@ -141,23 +163,20 @@ class OpenWeatherMapTool(Tool):
         wind_speed = current["wind"]["speed"]
         location_name = current["name"]
 
-        # Build current weather section
-        report = f"CURRENT WEATHER for {location_name}:\n"
-        report += f"- Temperature: {current_temp:.1f}{temp_unit} (feels like {feels_like:.1f}{temp_unit})\n"
-        report += f"- Conditions: {weather_desc}\n"
-        report += f"- Humidity: {humidity}%\n"
-        report += f"- Wind Speed: {wind_speed:.1f} {speed_unit}\n"
-
-        # Add forecast (next 24 hours - 8 data points at 3-hour intervals)
-        report += "\nFORECAST (Next 24 hours):\n"
-        for i, item in enumerate(forecast["list"][:8]):
-            from datetime import datetime
-
-            dt = datetime.fromtimestamp(item["dt"])
+        lines = [
+            f"CURRENT WEATHER for {location_name}:",
+            f"- Temperature: {current_temp:.1f}{temp_unit} (feels like {feels_like:.1f}{temp_unit})",
+            f"- Conditions: {weather_desc}",
+            f"- Humidity: {humidity}%",
+            f"- Wind Speed: {wind_speed:.1f} {speed_unit}",
+            "",
+            # Next 24 hours - 8 data points at 3-hour intervals
+            "FORECAST (Next 24 hours):",
+        ]
+        for item in forecast["list"][:8]:
+            time_str = datetime.fromtimestamp(item["dt"]).strftime("%I:%M %p")
             temp = item["main"]["temp"]
             desc = item["weather"][0]["description"]
-            time_str = dt.strftime("%I:%M %p")
-
-            report += f"- {time_str}: {temp:.1f}{temp_unit}, {desc}\n"
+            lines.append(f"- {time_str}: {temp:.1f}{temp_unit}, {desc}")
 
-        return report
+        return "\n".join(lines) + "\n"
@@ -1,12 +1,72 @@
 """Slack helper utilities."""
 
 import logging
-from typing import List, Optional, Dict, Any
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Optional, Dict, Any, Pattern, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Appended to responses cut down by format_slack_text
+_TRUNCATION_SUFFIX = "\n\n... (response truncated)"
+
+# Message subtypes that never warrant a response
+_IGNORED_SUBTYPES = frozenset(
+    {"message_changed", "message_deleted", "channel_join", "channel_leave"}
+)
+
+# Shared session so file downloads reuse keep-alive connections to files.slack.com
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
+# Largest Slack file download accepted, to bound memory on unexpectedly huge uploads
+_MAX_DOWNLOAD_BYTES = 20 * 1024 * 1024
+
+# ETag and body of recent small downloads, so fetching the same file again (e.g. for
+# an event Slack redelivers) can be answered with a 304. LRU bounded by entry count
+# and total bytes; guarded by a lock because images are downloaded from worker threads.
+_ETAG_CACHE_MAX_ENTRIES = 32
+_ETAG_CACHE_MAX_BYTES = 8 * 1024 * 1024
+_ETAG_CACHE_MAX_BODY_BYTES = 1024 * 1024
+_ETAG_CACHE: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+_ETAG_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _compile_keywords(keywords: Tuple[str, ...], case_sensitive: bool) -> Pattern:
+    """
+    Compile keywords into a single alternation pattern.
+
+    Cached so each channel's keyword list is compiled once and every message
+    is matched with one scan instead of one substring search per keyword.
+
+    Args:
+        keywords: Keywords to search for
+        case_sensitive: Whether to use case-sensitive matching
+
+    Returns:
+        Compiled regex pattern matching any keyword as a substring
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords), flags)
+
 
 def matches_keywords(
     text: str, keywords: List[str], case_sensitive: bool = False
@@ -26,33 +86,75 @@ def matches_keywords(
         # Empty keywords list means match everything
         return True
 
-    search_text = text if case_sensitive else text.lower()
-
-    for keyword in keywords:
-        search_keyword = keyword if case_sensitive else keyword.lower()
-        if search_keyword in search_text:
-            logger.debug(f"Matched keyword: {keyword}")
-            return True
+    match = _compile_keywords(tuple(keywords), case_sensitive).search(text)
+    if match:
+        logger.debug(f"Matched keyword: {match.group(0)}")
+        return True
 
     return False
 
 
-def download_slack_file(url: str, token: str) -> Optional[bytes]:
+def download_slack_file(
+    url: str,
+    token: str,
+    session: Optional[requests.Session] = None,
+    max_bytes: int = _MAX_DOWNLOAD_BYTES,
+) -> Optional[bytes]:
     """
     Download a file from Slack.
 
     Args:
         url: Slack file URL
         token: Slack bot token
+        session: Session to download with (defaults to the shared pooled session)
+        max_bytes: Largest file to accept; bigger downloads are abandoned
 
     Returns:
-        File bytes or None on error
+        File bytes or None on error or if the file exceeds max_bytes
     """
+    session = session or _SESSION
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return response.content
+        with _ETAG_CACHE_LOCK:
+            cached = _ETAG_CACHE.get(url)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        with session.get(url, headers=headers, timeout=30, stream=True) as response:
+            if cached and response.status_code == 304:
+                logger.debug(f"Slack file not modified, using cached copy: {url}")
+                with _ETAG_CACHE_LOCK:
+                    # Another thread may have evicted the entry since it was read
+                    if url in _ETAG_CACHE:
+                        _ETAG_CACHE.move_to_end(url)
+                return cached[1]
+            response.raise_for_status()
+
+            # Read in chunks so an oversized file is dropped before it is fully buffered
+            if int(response.headers.get("Content-Length") or 0) > max_bytes:
+                logger.error(f"Slack file exceeds {max_bytes} bytes, skipping: {url}")
+                return None
+            buffer = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buffer += chunk
+                if len(buffer) > max_bytes:
+                    logger.error(
+                        f"Slack file exceeds {max_bytes} bytes, skipping: {url}"
+                    )
+                    return None
+            etag = response.headers.get("ETag")
+
+        content = bytes(buffer)
+        if etag and len(content) <= _ETAG_CACHE_MAX_BODY_BYTES:
+            with _ETAG_CACHE_LOCK:
+                _ETAG_CACHE[url] = (etag, content)
+                _ETAG_CACHE.move_to_end(url)
+                while len(_ETAG_CACHE) > _ETAG_CACHE_MAX_ENTRIES or (
+                    sum(len(body) for _, body in _ETAG_CACHE.values())
+                    > _ETAG_CACHE_MAX_BYTES
+                ):
+                    _ETAG_CACHE.popitem(last=False)
+        return content
     except Exception as e:
         logger.error(f"Error downloading file from Slack: {e}")
         return None
@@ -72,34 +174,46 @@ def extract_message_images(
     Returns:
         List of dicts with 'data' (bytes) and 'mimetype' (str)
     """
-    images = []
-
-    # Check for files in the message
-    files = event.get("files", [])
+    files = event.get("files")
+    if not files:
+        return []
 
+    # Collect the image files that can be downloaded
+    image_files = []
     for file_obj in files:
-        # Check if it's an image
-        mimetype = file_obj.get("mimetype", "")
-        if mimetype.startswith("image/"):
-            # Download the file
-            url = file_obj.get("url_private")
-            if url:
-                image_data = download_slack_file(url, bot_token)
-                if image_data:
-                    images.append(
-                        {
-                            "data": image_data,
-                            "mimetype": mimetype,
-                            "filename": file_obj.get("name", "image"),
-                        }
-                    )
-                    logger.debug(
-                        f"Downloaded image: {file_obj.get('name')} ({mimetype})"
-                    )
-                else:
-                    logger.error(f"Failed to download image: {file_obj.get('name')}")
-            else:
-                logger.warning(f"No url_private found for file: {file_obj.get('name')}")
+        if not (file_obj.get("mimetype") or "").startswith("image/"):
+            continue
+        if file_obj.get("url_private"):
+            image_files.append(file_obj)
+        else:
+            logger.warning(f"No url_private found for file: {file_obj.get('name')}")
+
+    if not image_files:
+        return []
+
+    urls = [file_obj["url_private"] for file_obj in image_files]
+    if len(urls) == 1:
+        # The common single-image message needs no thread pool
+        results = [download_slack_file(urls[0], bot_token)]
+    else:
+        # Downloads are network-bound, so fetch them concurrently; map keeps file order
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            results = list(executor.map(download_slack_file, urls, repeat(bot_token)))
+
+    images = []
+    for file_obj, image_data in zip(image_files, results):
+        if image_data:
+            mimetype = file_obj["mimetype"]
+            images.append(
+                {
+                    "data": image_data,
+                    "mimetype": mimetype,
+                    "filename": file_obj.get("name", "image"),
+                }
+            )
+            logger.debug(f"Downloaded image: {file_obj.get('name')} ({mimetype})")
+        else:
+            logger.error(f"Failed to download image: {file_obj.get('name')}")
 
     return images
 
@@ -122,26 +236,17 @@ def should_ignore_message(
     Returns:
         True if message should be ignored, False otherwise
     """
+    # Checks are independent; run the one that most often matches on busy
+    # channels (edits, deletes, joins) first so most ignored events exit early
+    if event.get("subtype") in _IGNORED_SUBTYPES:
+        return True
+
     # Check if message is from a bot
     if ignore_bots and event.get("bot_id"):
         return True
 
     # Check if message is from self
-    user_id = event.get("user")
-    if ignore_self and user_id == bot_user_id:
-        return True
-
-    # Ignore message subtypes we don't care about
-    subtype = event.get("subtype")
-    if subtype in [
-        "message_changed",
-        "message_deleted",
-        "channel_join",
-        "channel_leave",
-    ]:
-        return True
-
-    return False
+    return ignore_self and event.get("user") == bot_user_id
 
 
 def format_slack_text(text: str, max_length: int = 3000) -> str:
@@ -158,5 +263,5 @@ def format_slack_text(text: str, max_length: int = 3000) -> str:
     if len(text) <= max_length:
         return text
 
-    # Truncate and add indicator
-    return text[: max_length - 50] + "\n\n... (response truncated)"
+    # Truncate so the text plus indicator fills exactly max_length
+    return text[: max_length - len(_TRUNCATION_SUFFIX)] + _TRUNCATION_SUFFIX
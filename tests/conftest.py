@@ -1,10 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
 import base64
-from unittest.mock import MagicMock
+from types import MappingProxyType
+from unittest.mock import Mock
 
 import pytest
-from slack_bolt import App
+import responses
 
 from src.utils.config import (
     AppConfig,
@@ -16,9 +17,36 @@ from src.utils.config import (
 )
 
 
+class Recorder:
+    """Minimal callable that records its calls, used in place of Mock for ack/say."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture
+def ack():
+    """Recording stand-in for the Slack ack function."""
+    return Recorder()
+
+
 @pytest.fixture
+def say():
+    """Recording stand-in for the Slack say function."""
+    return Recorder()
+
+
+@pytest.fixture(scope="session")
 def sample_llm_config():
-    """Sample LLM configuration."""
+    """
+    Sample LLM configuration
+    (read-only, shared across the session; use `model_copy(update=...)` to vary).
+    """
     return LLMConfig(
         api_key="test-api-key",
         model="anthropic/claude-3.5-sonnet",
@@ -27,9 +55,12 @@ def sample_llm_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_channel_config(sample_llm_config):
-    """Sample channel configuration."""
+    """
+    Sample channel configuration
+    (read-only, shared across the session; use `model_copy(update=...)` to vary).
+    """
     return ChannelConfig(
         channel_id="C12345",
         channel_name="test-channel",
@@ -43,9 +74,12 @@ def sample_channel_config(sample_llm_config):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_channel_config(sample_llm_config):
-    """Sample image analysis channel configuration."""
+    """
+    Sample image analysis channel configuration
+    (read-only, shared across the session; use `model_copy(update=...)` to vary).
+    """
     return ChannelConfig(
         channel_id="C54321",
         channel_name="image-analysis",
@@ -59,9 +93,12 @@ def sample_image_channel_config(sample_llm_config):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_command_config(sample_llm_config):
-    """Sample slash command configuration."""
+    """
+    Sample slash command configuration
+    (read-only, shared across the session; use `model_copy(update=...)` to vary).
+    """
     return SlashCommandConfig(
         command="/analyze",
         description="Analyze text with AI",
@@ -71,7 +108,7 @@ def sample_command_config(sample_llm_config):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_app_config(sample_channel_config, sample_command_config):
     """Sample application configuration."""
     return AppConfig(
@@ -81,11 +118,10 @@ def sample_app_config(sample_channel_config, sample_command_config):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_slack_app():
     """Mock Slack Bolt app."""
-    app = MagicMock(spec=App)
-    app.client = MagicMock()
+    app = Mock()
     app.client.auth_test.return_value = {"user_id": "U12345"}
     return app
 
@@ -123,32 +159,57 @@ def sample_slack_image_event():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_slack_command():
-    """Sample Slack slash command payload."""
-    return {
-        "command": "/analyze",
-        "text": "What is AI?",
-        "user_id": "U67890",
-        "channel_id": "C12345",
-        "response_url": "https://hooks.slack.com/commands/1234/5678",
-    }
+    """Sample Slack slash command payload (read-only, shared across the session)."""
+    return MappingProxyType(
+        {
+            "command": "/analyze",
+            "text": "What is AI?",
+            "user_id": "U67890",
+            "channel_id": "C12345",
+            "response_url": "https://hooks.slack.com/commands/1234/5678",
+        }
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_bytes():
-    """Sample image as bytes (1x1 red pixel PNG)."""
-    # Minimal valid PNG file
+    """Sample image as bytes (1x1 grayscale pixel PNG)."""
+    # Minimal valid PNG file (67 bytes)
     return base64.b64decode(
-        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8DwHwAFBQIAX8jx0gAAAABJRU5ErkJggg=="
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAAAAAA6fptVAAAACklEQVR42mP4DwABAQEAHLCMmQAAAABJRU5ErkJggg=="
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_image_b64(sample_image_bytes):
+    """Sample image as a base64 string, encoded once per session."""
+    return base64.b64encode(sample_image_bytes).decode("utf-8")
+
+
+@pytest.fixture(scope="session")
 def sample_image_info(sample_image_bytes):
-    """Sample image info dict."""
-    return {
-        "data": sample_image_bytes,
-        "mimetype": "image/png",
-        "filename": "test.png",
-    }
+    """Sample image info mapping (read-only, shared across the session)."""
+    return MappingProxyType(
+        {
+            "data": sample_image_bytes,
+            "mimetype": "image/png",
+            "filename": "test.png",
+        }
+    )
+
+
+@pytest.fixture
+def mock_slack_files(sample_image_bytes):
+    """Register mocked downloads for Slack files; URLs in ``failing`` return 404."""
+
+    def _register(files, failing=()):
+        for file_obj in files:
+            url = file_obj["url_private"]
+            if url in failing:
+                responses.add(responses.GET, url, status=404)
+            else:
+                responses.add(responses.GET, url, body=sample_image_bytes, status=200)
+
+    return _register
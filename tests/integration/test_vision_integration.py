@@ -95,7 +95,9 @@ class TestVisionIntegration:
         }
 
         # Mock file download
-        responses.add(responses.GET, image_url, body=sample_image_bytes, status=200)
+        responses.add_callback(
+            responses.GET, image_url, callback=lambda req: (200, {}, sample_image_bytes)
+        )
 
         # Mock Slack client methods
         say = Mock()
@@ -171,8 +173,10 @@ class TestVisionIntegration:
 
         # Mock downloads
         for file in event["files"]:
-            responses.add(
-                responses.GET, file["url_private"], body=sample_image_bytes, status=200
+            responses.add_callback(
+                responses.GET,
+                file["url_private"],
+                callback=lambda req: (200, {}, sample_image_bytes),
             )
 
         say = Mock()
@@ -215,11 +219,10 @@ class TestVisionIntegration:
         )
 
         # Mock file download
-        responses.add(
+        responses.add_callback(
             responses.GET,
             "https://files.slack.com/image.png",
-            body=sample_image_bytes,
-            status=200,
+            callback=lambda req: (200, {}, sample_image_bytes),
         )
 
         event = {
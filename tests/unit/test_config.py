@@ -4,7 +4,6 @@ import tempfile
 from pathlib import Path
 
 import pytest
-import yaml
 
 from src.utils.config import (
     load_config,
@@ -13,6 +12,38 @@ from src.utils.config import (
     AppConfig,
 )
 
+_VALID_CONFIG_YAML = """\
+channels:
+  - channel_id: C12345
+    channel_name: test
+    llm:
+      api_key: test-key
+      model: test-model
+    system_prompt: Test prompt
+slash_commands:
+  - command: /test
+    description: Test command
+    llm:
+      api_key: test-key
+      model: test-model
+    system_prompt: Test prompt
+settings: {}
+"""
+
+
+@pytest.fixture(scope="module")
+def yaml_config_path(tmp_path_factory):
+    """Write a valid configuration file once for the module."""
+    config_file = tmp_path_factory.mktemp("config") / "config.yaml"
+    config_file.write_text(_VALID_CONFIG_YAML)
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def loaded_app_config(yaml_config_path):
+    """Configuration parsed from yaml_config_path (treat as read-only)."""
+    return load_config(str(yaml_config_path))
+
 
 def test_llm_config_validation():
     """Test LLM configuration validation."""
@@ -63,33 +94,9 @@ def test_load_config_file_not_found():
         load_config("nonexistent.yaml")
 
 
-def test_load_config_valid(tmp_path):
+def test_load_config_valid(loaded_app_config):
     """Test loading valid configuration file."""
-    config_data = {
-        "channels": [
-            {
-                "channel_id": "C12345",
-                "channel_name": "test",
-                "llm": {"api_key": "test-key", "model": "test-model"},
-                "system_prompt": "Test prompt",
-            }
-        ],
-        "slash_commands": [
-            {
-                "command": "/test",
-                "description": "Test command",
-                "llm": {"api_key": "test-key", "model": "test-model"},
-                "system_prompt": "Test prompt",
-            }
-        ],
-        "settings": {},
-    }
-
-    config_file = tmp_path / "config.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(config_data, f)
-
-    config = load_config(str(config_file))
+    config = loaded_app_config
 
     assert isinstance(config, AppConfig)
     assert len(config.channels) == 1
@@ -97,11 +104,21 @@ def test_load_config_valid(tmp_path):
     assert config.channels[0].channel_id == "C12345"
 
 
+def test_load_config_applies_defaults(loaded_app_config):
+    """Test that fields omitted from the YAML fall back to their defaults."""
+    channel = loaded_app_config.channels[0]
+
+    assert channel.enabled is True
+    assert channel.keywords == []
+    assert channel.llm.base_url == "https://openrouter.ai/api/v1"
+    assert loaded_app_config.settings.max_message_length == 10000
+
+
 def test_disabled_channel_config(sample_channel_config):
     """Test that disabled channels can be configured."""
-    sample_channel_config.enabled = False
+    disabled_channel = sample_channel_config.model_copy(update={"enabled": False})
     config = AppConfig(
-        channels=[sample_channel_config],
+        channels=[disabled_channel],
         slash_commands=[],
     )
 
@@ -1,16 +1,93 @@
 """Tests for RSS Feed tool and factory integration."""
 
 import json
-import os
-import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from pathlib import Path
+from typing import Optional
 
 import pytest
+from feedparser import FeedParserDict
 
 from src.tools.factory import create_tool
 from src.tools.implementations.rssfeed import RSSFeedTool
 
+# FeedParserDict warns when the tool probes for the absent updated_parsed key.
+pytestmark = pytest.mark.filterwarnings(
+    "ignore:To avoid breaking existing software:DeprecationWarning"
+)
+
+# Five dated entries; the tool only reads them, so tests can share the objects
+_ENTRIES_5 = tuple(
+    FeedParserDict(
+        id=f"article-{i}",
+        title=f"Article {i}",
+        link=f"https://example.com/article{i}",
+        summary=f"Summary {i}",
+        published_parsed=(2024, 1, i + 1, 10, 0, 0, 0, 0, 0),
+    )
+    for i in range(5)
+)
+
+
+@dataclass
+class FakeFeed:
+    """Stand-in for a feedparser result with a real dict for feed metadata."""
+
+    bozo: bool = False
+    feed: dict = field(default_factory=lambda: {"title": "Test Feed"})
+    bozo_exception: Optional[Exception] = None
+    entries: list = field(default_factory=list)
+
+
+@pytest.fixture
+def make_feed(monkeypatch):
+    """Builder that registers a FakeFeed as feedparser's result for a URL."""
+    feeds = {}
+    monkeypatch.setattr(
+        "src.tools.implementations.rssfeed.feedparser.parse", feeds.__getitem__
+    )
+
+    def _make(
+        entries=(), url="https://example.com/feed.xml", title="Test Feed", **kwargs
+    ):
+        feeds[url] = FakeFeed(feed={"title": title}, entries=list(entries), **kwargs)
+        return feeds[url]
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def rss_tmpdir(tmp_path_factory):
+    """Temporary directory shared by the RSS tests in this module."""
+    return tmp_path_factory.mktemp("rss")
+
+
+@pytest.fixture
+def data_file(rss_tmpdir, request):
+    """Per-test seen-articles file inside the shared directory."""
+    return str(rss_tmpdir / f"seen_{request.node.name}.json")
+
+
+@pytest.fixture(scope="module")
+def clean_tool():
+    """Shared tool for tests of the pure _clean_summary helper."""
+    return RSSFeedTool(feed_urls=["https://example.com/feed.xml"])
+
+
+@pytest.fixture
+def in_memory_store(monkeypatch):
+    """Replace the tool's seen-articles file with a dict for non-persistence tests."""
+    store = {}
+
+    def save_seen_ids(self, seen_ids):
+        store.clear()
+        store.update(seen_ids)
+
+    monkeypatch.setattr(RSSFeedTool, "_load_seen_ids", lambda self: dict(store))
+    monkeypatch.setattr(RSSFeedTool, "_save_seen_ids", save_seen_ids)
+    return store
+
 
 class TestRSSFeedTool:
     """Tests for RSSFeedTool."""
@@ -36,291 +113,201 @@ class TestRSSFeedTool:
         assert tool.data_file == "custom/path/seen.json"
         assert tool.max_stories == 5
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_with_new_stories(self, mock_parse):
+    def test_execute_with_new_stories(self, make_feed, in_memory_store):
         """Test execution when new stories are found."""
         # Mock feed response
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="article-1",
-                title="Test Article 1",
-                link="https://example.com/article1",
-                summary="<p>Summary of article 1</p>",
-                published_parsed=(2024, 1, 15, 10, 30, 0, 0, 0, 0),
-            ),
-            MagicMock(
-                id="article-2",
-                title="Test Article 2",
-                link="https://example.com/article2",
-                summary="Summary of article 2",
-                published_parsed=(2024, 1, 14, 9, 0, 0, 0, 0, 0),
-            ),
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
-                max_stories=10,
-            )
+        make_feed(
+            [
+                FeedParserDict(
+                    id="article-1",
+                    title="Test Article 1",
+                    link="https://example.com/article1",
+                    summary="<p>Summary of article 1</p>",
+                    published_parsed=(2024, 1, 15, 10, 30, 0, 0, 0, 0),
+                ),
+                FeedParserDict(
+                    id="article-2",
+                    title="Test Article 2",
+                    link="https://example.com/article2",
+                    summary="Summary of article 2",
+                    published_parsed=(2024, 1, 14, 9, 0, 0, 0, 0, 0),
+                ),
+            ]
+        )
+
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            max_stories=10,
+        )
 
-            context = {"user_input": "get news"}
-            result = tool.execute(context)
+        context = {"user_input": "get news"}
+        result = tool.execute(context)
 
-            # Verify result contains story info
-            assert "NEW STORIES" in result
-            assert "Test Article 1" in result
-            assert "Test Article 2" in result
-            assert "Test Feed" in result
+        # Verify result contains story info
+        assert "NEW STORIES" in result
+        assert "Test Article 1" in result
+        assert "Test Article 2" in result
+        assert "Test Feed" in result
 
-            # Verify seen IDs were saved
-            assert os.path.exists(data_file)
-            with open(data_file, "r") as f:
-                data = json.load(f)
-                assert "article-1" in data["seen_ids"]
-                assert "article-2" in data["seen_ids"]
+        # Verify seen IDs were saved
+        assert {"article-1", "article-2"} <= in_memory_store.keys()
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_filters_seen_stories(self, mock_parse):
+    def test_execute_filters_seen_stories(self, make_feed, in_memory_store):
         """Test that previously seen stories are filtered out."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="article-1",
-                title="Already Seen",
-                link="https://example.com/article1",
-                summary="Old article",
-                published_parsed=None,
-            ),
-            MagicMock(
-                id="article-new",
-                title="New Article",
-                link="https://example.com/new",
-                summary="Fresh content",
-                published_parsed=None,
-            ),
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
-
-            # Pre-populate with seen article
-            with open(data_file, "w") as f:
-                json.dump({"seen_ids": ["article-1"]}, f)
-
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
-            )
+        make_feed(
+            [
+                FeedParserDict(
+                    id="article-1",
+                    title="Already Seen",
+                    link="https://example.com/article1",
+                    summary="Old article",
+                    published_parsed=None,
+                ),
+                FeedParserDict(
+                    id="article-new",
+                    title="New Article",
+                    link="https://example.com/new",
+                    summary="Fresh content",
+                    published_parsed=None,
+                ),
+            ]
+        )
+
+        # Pre-populate with seen article
+        in_memory_store["article-1"] = datetime.now().isoformat()
+
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+        )
 
-            result = tool.execute({})
+        result = tool.execute({})
 
-            assert "New Article" in result
-            assert "Already Seen" not in result
+        assert "New Article" in result
+        assert "Already Seen" not in result
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_respects_max_stories(self, mock_parse):
+    def test_execute_respects_max_stories(self, make_feed, in_memory_store):
         """Test that max_stories limit is respected."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id=f"article-{i}",
-                title=f"Article {i}",
-                link=f"https://example.com/article{i}",
-                summary=f"Summary {i}",
-                published_parsed=(2024, 1, i + 1, 10, 0, 0, 0, 0, 0),
-            )
-            for i in range(5)
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=os.path.join(tmpdir, "seen.json"),
-                max_stories=2,
-            )
+        make_feed(_ENTRIES_5)
+
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            max_stories=2,
+        )
 
-            result = tool.execute({})
+        result = tool.execute({})
 
-            # Should only have 2 articles in the output
-            assert result.count("[") == 2
+        # Should only have 2 articles in the output
+        assert result.count("[") == 2
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_handles_empty_feed(self, mock_parse):
+    def test_execute_handles_empty_feed(self, make_feed, in_memory_store):
         """Test handling of empty feeds."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Empty Feed"
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/empty.xml"],
-                data_file=os.path.join(tmpdir, "seen.json"),
-            )
+        make_feed(url="https://example.com/empty.xml", title="Empty Feed")
 
-            result = tool.execute({})
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/empty.xml"],
+        )
+
+        result = tool.execute({})
 
-            assert "No new stories found" in result
+        assert "No new stories found" in result
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_handles_feed_error(self, mock_parse):
+    def test_execute_handles_feed_error(self, make_feed, in_memory_store):
         """Test handling of feed parsing errors."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = True
-        mock_feed.bozo_exception = Exception("Parse error")
-        mock_feed.entries = []
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/bad.xml"],
-                data_file=os.path.join(tmpdir, "seen.json"),
-            )
+        make_feed(
+            url="https://example.com/bad.xml",
+            bozo=True,
+            bozo_exception=Exception("Parse error"),
+        )
 
-            result = tool.execute({})
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/bad.xml"],
+        )
 
-            # Should return no stories message (feed error is logged)
-            assert "No new stories found" in result
+        result = tool.execute({})
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_execute_multiple_feeds(self, mock_parse):
-        """Test fetching from multiple feeds."""
-        feed1 = MagicMock()
-        feed1.bozo = False
-        feed1.feed.get.return_value = "Feed 1"
-        feed1.entries = [
-            MagicMock(
-                id="feed1-article",
-                title="From Feed 1",
-                link="https://feed1.com/article",
-                summary="Content from feed 1",
-                published_parsed=None,
-            )
-        ]
-
-        feed2 = MagicMock()
-        feed2.bozo = False
-        feed2.feed.get.return_value = "Feed 2"
-        feed2.entries = [
-            MagicMock(
-                id="feed2-article",
-                title="From Feed 2",
-                link="https://feed2.com/article",
-                summary="Content from feed 2",
-                published_parsed=None,
-            )
-        ]
+        # Should return no stories message (feed error is logged)
+        assert "No new stories found" in result
 
-        mock_parse.side_effect = [feed1, feed2]
+    def test_execute_multiple_feeds(self, make_feed, in_memory_store):
+        """Test fetching from multiple feeds."""
+        make_feed(
+            [
+                FeedParserDict(
+                    id="feed1-article",
+                    title="From Feed 1",
+                    link="https://feed1.com/article",
+                    summary="Content from feed 1",
+                    published_parsed=None,
+                )
+            ],
+            url="https://feed1.com/rss",
+            title="Feed 1",
+        )
+        make_feed(
+            [
+                FeedParserDict(
+                    id="feed2-article",
+                    title="From Feed 2",
+                    link="https://feed2.com/article",
+                    summary="Content from feed 2",
+                    published_parsed=None,
+                )
+            ],
+            url="https://feed2.com/rss",
+            title="Feed 2",
+        )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tool = RSSFeedTool(
-                feed_urls=["https://feed1.com/rss", "https://feed2.com/rss"],
-                data_file=os.path.join(tmpdir, "seen.json"),
-            )
+        tool = RSSFeedTool(
+            feed_urls=["https://feed1.com/rss", "https://feed2.com/rss"],
+        )
 
-            result = tool.execute({})
-
-            assert "From Feed 1" in result
-            assert "From Feed 2" in result
-            assert "Feed 1" in result
-            assert "Feed 2" in result
-
-    def test_persistence_across_executions(self):
-        """Test that seen IDs persist across tool executions."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
-
-            # First execution
-            with patch(
-                "src.tools.implementations.rssfeed.feedparser.parse"
-            ) as mock_parse:
-                mock_feed = MagicMock()
-                mock_feed.bozo = False
-                mock_feed.feed.get.return_value = "Test Feed"
-                mock_feed.entries = [
-                    MagicMock(
-                        id="article-1",
-                        title="First Article",
-                        link="https://example.com/1",
-                        summary="First",
-                        published_parsed=None,
-                    )
-                ]
-                mock_parse.return_value = mock_feed
-
-                tool1 = RSSFeedTool(
-                    feed_urls=["https://example.com/feed.xml"],
-                    data_file=data_file,
-                )
-                result1 = tool1.execute({})
-                assert "First Article" in result1
-
-            # Second execution with new tool instance
-            with patch(
-                "src.tools.implementations.rssfeed.feedparser.parse"
-            ) as mock_parse:
-                mock_feed = MagicMock()
-                mock_feed.bozo = False
-                mock_feed.feed.get.return_value = "Test Feed"
-                mock_feed.entries = [
-                    MagicMock(
-                        id="article-1",
-                        title="First Article",
-                        link="https://example.com/1",
-                        summary="First",
-                        published_parsed=None,
-                    ),
-                    MagicMock(
-                        id="article-2",
-                        title="Second Article",
-                        link="https://example.com/2",
-                        summary="Second",
-                        published_parsed=None,
-                    ),
-                ]
-                mock_parse.return_value = mock_feed
-
-                tool2 = RSSFeedTool(
-                    feed_urls=["https://example.com/feed.xml"],
-                    data_file=data_file,
+        result = tool.execute({})
+
+        assert "From Feed 1" in result
+        assert "From Feed 2" in result
+        assert "Feed 1" in result
+        assert "Feed 2" in result
+
+    def test_persistence_across_executions(self, make_feed, data_file):
+        """Test that seen IDs saved by one tool are loaded by the next."""
+        make_feed(
+            [
+                FeedParserDict(
+                    id="article-1",
+                    title="First Article",
+                    link="https://example.com/1",
+                    summary="First",
+                    published_parsed=None,
                 )
-                result2 = tool2.execute({})
+            ]
+        )
 
-                # First article should not appear (already seen)
-                assert "First Article" not in result2
-                assert "Second Article" in result2
+        tool1 = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
+        assert "First Article" in tool1.execute({})
 
-    def test_clean_summary_removes_html(self):
-        """Test that HTML tags are removed from summaries."""
-        tool = RSSFeedTool(feed_urls=["https://example.com/feed.xml"])
+        # A new tool instance reads back what the first one saved
+        tool2 = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
+        assert "article-1" in tool2._load_seen_ids()
 
+    def test_clean_summary_removes_html(self, clean_tool):
+        """Test that HTML tags are removed from summaries."""
         html_summary = "<p>This is a <b>test</b> with <a href='#'>links</a>.</p>"
-        clean = tool._clean_summary(html_summary)
+        clean = clean_tool._clean_summary(html_summary)
 
         assert "<" not in clean
         assert ">" not in clean
         assert "This is a test with links." in clean
 
-    def test_clean_summary_truncates_long_text(self):
+    def test_clean_summary_truncates_long_text(self, clean_tool):
         """Test that long summaries are truncated."""
-        tool = RSSFeedTool(feed_urls=["https://example.com/feed.xml"])
-
         long_summary = "x" * 600
-        clean = tool._clean_summary(long_summary)
+        clean = clean_tool._clean_summary(long_summary)
 
         assert len(clean) <= 500
         assert clean.endswith("...")
@@ -329,175 +316,147 @@ class TestRSSFeedTool:
 class TestRSSFeedToolTTL:
     """Tests for RSS Feed tool TTL-based expiry."""
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_old_format_migration(self, mock_parse):
+    def test_old_format_migration(self, make_feed, data_file):
         """Test that old format (list of IDs) is migrated to new format (dict with timestamps)."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="new-article",
-                title="New Article",
-                link="https://example.com/new",
-                summary="Fresh",
-                published_parsed=None,
-            )
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
+        make_feed(
+            [
+                FeedParserDict(
+                    id="new-article",
+                    title="New Article",
+                    link="https://example.com/new",
+                    summary="Fresh",
+                    published_parsed=None,
+                )
+            ]
+        )
 
-            # Write old format (list of IDs)
-            with open(data_file, "w") as f:
-                json.dump({"seen_ids": ["old-article-1", "old-article-2"]}, f)
+        # Write old format (list of IDs)
+        with open(data_file, "w") as f:
+            json.dump({"seen_ids": ["old-article-1", "old-article-2"]}, f)
 
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
-            )
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
 
-            result = tool.execute({})
+        result = tool.execute({})
 
-            # Old articles should still be recognized as seen
-            assert "New Article" in result
+        # Old articles should still be recognized as seen
+        assert "New Article" in result
 
-            # Verify file was migrated to new format
-            with open(data_file, "r") as f:
-                data = json.load(f)
-                # seen_ids should now be a dict with timestamps
-                assert isinstance(data["seen_ids"], dict)
-                assert "old-article-1" in data["seen_ids"]
-                assert "old-article-2" in data["seen_ids"]
-                assert "new-article" in data["seen_ids"]
+        # Verify file was migrated to new format
+        seen_ids = json.loads(Path(data_file).read_text())["seen_ids"]
+        # seen_ids should now be a dict with timestamps
+        assert isinstance(seen_ids, dict)
+        assert {"old-article-1", "old-article-2", "new-article"} <= seen_ids.keys()
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_expired_articles_are_pruned(self, mock_parse):
+    def test_expired_articles_are_pruned(self, make_feed, data_file):
         """Test that articles older than 7 days are pruned and no longer filtered."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="expired-article",
-                title="Was Expired",
-                link="https://example.com/expired",
-                summary="Old content",
-                published_parsed=None,
-            ),
-            MagicMock(
-                id="recent-article",
-                title="Recent Article",
-                link="https://example.com/recent",
-                summary="Recent content",
-                published_parsed=None,
-            ),
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
-
-            # Write file with one expired and one recent article
-            expired_ts = (datetime.now() - timedelta(days=8)).isoformat()
-            recent_ts = (datetime.now() - timedelta(days=1)).isoformat()
-
-            with open(data_file, "w") as f:
-                json.dump(
-                    {
-                        "seen_ids": {
-                            "expired-article": expired_ts,
-                            "recent-article": recent_ts,
-                        },
-                        "last_updated": datetime.now().isoformat(),
-                    },
-                    f,
-                )
+        make_feed(
+            [
+                FeedParserDict(
+                    id="expired-article",
+                    title="Was Expired",
+                    link="https://example.com/expired",
+                    summary="Old content",
+                    published_parsed=None,
+                ),
+                FeedParserDict(
+                    id="recent-article",
+                    title="Recent Article",
+                    link="https://example.com/recent",
+                    summary="Recent content",
+                    published_parsed=None,
+                ),
+            ]
+        )
 
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
-            )
+        # Write file with one expired and one recent article
+        expired_ts = (datetime.now() - timedelta(days=8)).isoformat()
+        recent_ts = (datetime.now() - timedelta(days=1)).isoformat()
 
-            result = tool.execute({})
+        with open(data_file, "w") as f:
+            json.dump(
+                {
+                    "seen_ids": {
+                        "expired-article": expired_ts,
+                        "recent-article": recent_ts,
+                    },
+                    "last_updated": datetime.now().isoformat(),
+                },
+                f,
+            )
 
-            # Expired article should appear as new (it was pruned)
-            assert "Was Expired" in result
-            # Recent article should NOT appear (still seen)
-            assert "Recent Article" not in result
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_recent_articles_not_pruned(self, mock_parse):
-        """Test that articles within 7 days are preserved."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="recent-article",
-                title="Recent",
-                link="https://example.com/recent",
-                summary="Recent",
-                published_parsed=None,
-            )
-        ]
-        mock_parse.return_value = mock_feed
+        result = tool.execute({})
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
+        # Expired article should appear as new (it was pruned)
+        assert "Was Expired" in result
+        # Recent article should NOT appear (still seen)
+        assert "Recent Article" not in result
 
-            recent_ts = (datetime.now() - timedelta(days=3)).isoformat()
-            with open(data_file, "w") as f:
-                json.dump(
-                    {"seen_ids": {"recent-article": recent_ts}},
-                    f,
+    def test_recent_articles_not_pruned(self, make_feed, data_file):
+        """Test that articles within 7 days are preserved."""
+        make_feed(
+            [
+                FeedParserDict(
+                    id="recent-article",
+                    title="Recent",
+                    link="https://example.com/recent",
+                    summary="Recent",
+                    published_parsed=None,
                 )
+            ]
+        )
 
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
+        recent_ts = (datetime.now() - timedelta(days=3)).isoformat()
+        with open(data_file, "w") as f:
+            json.dump(
+                {"seen_ids": {"recent-article": recent_ts}},
+                f,
             )
 
-            result = tool.execute({})
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
+
+        result = tool.execute({})
 
-            # Should be filtered (still within TTL)
-            assert "No new stories found" in result
+        # Should be filtered (still within TTL)
+        assert "No new stories found" in result
 
-    @patch("src.tools.implementations.rssfeed.feedparser.parse")
-    def test_new_format_saved_with_timestamps(self, mock_parse):
+    def test_new_format_saved_with_timestamps(self, make_feed, data_file):
         """Test that newly seen articles are saved with timestamps."""
-        mock_feed = MagicMock()
-        mock_feed.bozo = False
-        mock_feed.feed.get.return_value = "Test Feed"
-        mock_feed.entries = [
-            MagicMock(
-                id="article-1",
-                title="Article 1",
-                link="https://example.com/1",
-                summary="Summary",
-                published_parsed=None,
-            )
-        ]
-        mock_parse.return_value = mock_feed
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            data_file = os.path.join(tmpdir, "seen.json")
+        make_feed(
+            [
+                FeedParserDict(
+                    id="article-1",
+                    title="Article 1",
+                    link="https://example.com/1",
+                    summary="Summary",
+                    published_parsed=None,
+                )
+            ]
+        )
 
-            tool = RSSFeedTool(
-                feed_urls=["https://example.com/feed.xml"],
-                data_file=data_file,
-            )
+        tool = RSSFeedTool(
+            feed_urls=["https://example.com/feed.xml"],
+            data_file=data_file,
+        )
 
-            tool.execute({})
+        tool.execute({})
 
-            with open(data_file, "r") as f:
-                data = json.load(f)
-                assert isinstance(data["seen_ids"], dict)
-                assert "article-1" in data["seen_ids"]
-                # Value should be an ISO timestamp string
-                ts = datetime.fromisoformat(data["seen_ids"]["article-1"])
-                assert (datetime.now() - ts).total_seconds() < 60
+        data = json.loads(Path(data_file).read_text())
+        assert isinstance(data["seen_ids"], dict)
+        assert "article-1" in data["seen_ids"]
+        # Value should be an ISO timestamp string
+        ts = datetime.fromisoformat(data["seen_ids"]["article-1"])
+        assert (datetime.now() - ts).total_seconds() < 60
 
 
 class TestRSSFeedToolFactory: